@@ -2,12 +2,13 @@ import atexit
 import datetime
 import json
 import os
-import shutil
 import signal
 import sqlite3
 import subprocess
 import sys
+import threading
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import IntEnum
 from pathlib import Path
@@ -112,8 +113,95 @@ class Theseus:
         self.loglevel = loglevel
 
         self.__interrupted = True
+        # connection and bulk() state are per thread, see _connection
+        self._local = threading.local()
+        # connections inherited from a parent process, kept referenced so they are never closed (and the parent's
+        # handle finalized) in the child
+        self._inherited: list[sqlite3.Connection] = []
+        self._vc_getter = None
         self._init_db(self.db_path)
 
+    def _connection(self) -> sqlite3.Connection:
+        # keep a connection open for the lifetime of this object, rather than reconnecting (and re-reading the
+        # schema) on every call. sqlite connections can't be shared between threads, or carried across a fork,
+        # so each thread gets its own and a forked process opens a fresh one.
+        local = self._local
+        if getattr(local, "conn", None) is not None and local.pid != os.getpid():
+            self._inherited.append(local.conn)
+            local.conn = None
+        if getattr(local, "conn", None) is None:
+            local.conn = sqlite3.connect(self.db_path)
+            local.conn.row_factory = sqlite3.Row
+            local.pid = os.getpid()
+            # one entry per open bulk() block, holding the run folders to remove once it commits
+            local.bulk = []
+        return local.conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._connection()
+        if self._local.bulk:
+            # the enclosing bulk() block owns the transaction
+            yield conn
+        else:
+            with conn:
+                yield conn
+
+    @contextmanager
+    def bulk(self):
+        """
+        Groups all database writes made inside the block into a single transaction, committed when the block exits.
+        Useful when starting or logging many experiments at once, since each write otherwise commits on its own.
+        If the block raises, its writes are rolled back; a nested block rolls back only its own writes, using a
+        savepoint. Run folders created by start() are left on disk, while folders of experiments deleted inside the
+        block are only removed once the outermost block commits.
+        """
+        conn = self._connection()
+        stack = self._local.bulk
+        savepoint = f"ariadne_bulk_{len(stack)}"
+        if stack:
+            conn.execute(f"SAVEPOINT {savepoint}")
+        else:
+            conn.execute("BEGIN IMMEDIATE")
+
+        stack.append([])
+        try:
+            yield self
+        except BaseException:
+            stack.pop()
+            if stack:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+            else:
+                conn.rollback()
+            raise
+        else:
+            folders = stack.pop()
+            if stack:
+                conn.execute(f"RELEASE {savepoint}")
+                stack[-1].extend(folders)
+            else:
+                conn.commit()
+                for folder in folders:
+                    remove_folder(folder)
+
+    def close(self):
+        """
+        Closes the calling thread's database connection. It will be reopened if this object is used again.
+
+        Raises:
+            RuntimeError: If called inside a bulk() block, whose transaction would otherwise be lost.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            if self._local.pid == os.getpid():
+                if self._local.bulk:
+                    raise RuntimeError("Cannot close the database connection inside a bulk() block.")
+                conn.close()
+            else:
+                self._inherited.append(conn)
+            self._local.conn = None
+
     def _setup(self, db_id: int):
         def signal_handler(signum, frame):
             self.__interrupted = True
@@ -128,11 +216,17 @@ class Theseus:
             signal.signal(sig, signal_handler)
         atexit.register(self._cleanup, db_id)
 
+    def _vc_changeset_and_msg(self):
+        # probing for jj/git costs a subprocess each, so only do it on the first start and remember which to query
+        if self._vc_getter is None:
+            self._vc_getter = detect_vc_getter()
+        return self._vc_getter()
+
     def _init_db(self, db_path: str | Path):
         if self.loglevel >= Theseus.LogLevel.DEBUG:
             print(f"Ariadne: Initializing database at {db_path}")
 
-        with sqlite3.connect(db_path) as conn:
+        with self._transaction() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS experiments (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -189,32 +283,18 @@ class Theseus:
         if self.loglevel >= Theseus.LogLevel.DEBUG:
             print(f"Ariadne: Creating temporary run folder for experiment '{name}' at {temp_run_folder}")
         try:
-            os.makedirs(temp_run_folder)
+            try:
+                os.mkdir(temp_run_folder)
+            except FileNotFoundError:
+                # exp_dir doesn't exist yet, only the case for the first experiment
+                os.makedirs(temp_run_folder)
 
             with open(temp_run_folder / "config.json", "w") as f:
                 json.dump(run_config, f, indent=2)
 
-            try:
-                if (
-                    subprocess.run(["jj"], capture_output=True, text=True, check=False).returncode
-                    == 0
-                ):
-                    changeset, msg = get_jj_changeset_and_msg()
-            except FileNotFoundError:
-                changeset, msg = None, None
-
-            try:
-                if (
-                    subprocess.run(
-                        ["git", "rev-parse"], capture_output=True, text=True, check=False
-                    ).returncode
-                    == 0
-                ):
-                    changeset, msg = get_git_hash_and_msg()
-            except FileNotFoundError:
-                changeset, msg = None, None
+            changeset, msg = self._vc_changeset_and_msg()
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self._transaction() as conn:
                 cursor = conn.cursor()
                 res = cursor.execute(
                     """
@@ -223,7 +303,7 @@ class Theseus:
                 """,
                     (
                         name,
-                        datetime.datetime.now().isoformat(),
+                        now.isoformat(),
                         json.dumps(run_config),
                         json.dumps({}),
                         str(run_folder),
@@ -247,7 +327,7 @@ class Theseus:
                 if self.loglevel >= Theseus.LogLevel.INFO:
                     print(f"Ariadne: Error starting experiment '{name}': {e}. Cleaning up DB entry.")
                 try:
-                    with sqlite3.connect(self.db_path) as conn:
+                    with self._transaction() as conn:
                         conn.execute("DELETE FROM experiments WHERE id = ?", (db_id,))
                 except sqlite3.Error as cleanup_err:
                     print(
@@ -256,8 +336,7 @@ class Theseus:
                         f"Cleanup Error: {cleanup_err}. Original Error: {e}"
                     )
 
-            if temp_run_folder.exists():
-                shutil.rmtree(temp_run_folder)
+            remove_folder(temp_run_folder)
 
             raise e
 
@@ -272,8 +351,7 @@ class Theseus:
         Raises:
             ValueError: If no uncompleted experiment with the given name is found to resume.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -306,38 +384,33 @@ class Theseus:
         """
         Starts a temporary experiment.
         Creates a new run folder in the users /tmp directory. This run does not update the database entry.
-
-        Raises:
-            FileExistsError: If a run folder with the same name already exists.
+        The folder is created with mode 0o700, so it is only accessible to the current user.
         """
+        import tempfile
+
         now = datetime.datetime.now()
-        run_folder = (Path("/tmp") / f"ariadne_test_{now.strftime('%Y-%m-%d-%H-%M-%S')}_{uuid.uuid4().hex[:4]}").resolve()
+        # mkdtemp atomically creates a uniquely named folder, so there is no need to check for clashes first
+        run_folder = Path(
+            tempfile.mkdtemp(prefix=f"ariadne_test_{now.strftime('%Y-%m-%d-%H-%M-%S')}_", dir="/tmp")
+        ).resolve()
 
         if self.loglevel >= Theseus.LogLevel.INFO:
             print(f"Ariadne: Starting temporary experiment in {run_folder}")
 
-        if run_folder.exists():
-            raise FileExistsError(f"Run folder {run_folder} already exists.")
-
         try:
             db_id = -1
-            os.makedirs(run_folder)
 
             self._setup(db_id)
-            return db_id, run_folder.resolve()
+            return db_id, run_folder
 
         except Exception as e:
-            if run_folder.exists():
-                # DB entry was created, but run folder creation failed
-                print(f"Ariadne: Error starting temporary experiment: {e}. Cleaning up run folder.")
-                shutil.rmtree(run_folder)
-            else:
-                print(f"Ariadne: Error starting temporary experiment: {e}.")
+            print(f"Ariadne: Error starting temporary experiment: {e}. Cleaning up run folder.")
+            remove_folder(run_folder)
             raise e
 
 
     def log(self, id: int, logs: dict):
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             conn.execute(
                 """
                 UPDATE experiments
@@ -349,9 +422,7 @@ class Theseus:
 
     def get(self, name: str) -> list[Spool]:
         out = []
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-
+        with self._transaction() as conn:
             for row in conn.execute(
                 """
                 SELECT * FROM experiments WHERE name LIKE ?
@@ -362,9 +433,7 @@ class Theseus:
         return out
 
     def get_by_id(self, id: int) -> Spool | None:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -380,9 +449,7 @@ class Theseus:
         raise ValueError(f"No experiment found with ID {id}.")
 
     def peek(self) -> Spool | None:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT * FROM experiments ORDER BY timestamp DESC LIMIT 1
@@ -395,8 +462,7 @@ class Theseus:
         return None
 
     def list(self) -> list[Spool]:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._transaction() as conn:
             out = []
             for row in conn.execute("""
                 SELECT * FROM experiments
@@ -411,20 +477,18 @@ class Theseus:
         Raises:
             ValueError: If no experiment with the given ID is found.
         """
-        if append:
-            current = self.get_by_id(id)
-            if current and current.notes:
-                text = current.notes + "\n" + text
-
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        # append in the same statement, rather than reading the current notes back first
+        with self._transaction() as conn:
+            cursor = conn.execute(
                 """
                 UPDATE experiments
-                SET notes = ?
+                SET notes = CASE WHEN ? AND notes != '' THEN notes || char(10) || ? ELSE ? END
                 WHERE id = ?
                 """,
-                (text, id),
+                (append, text, text, id),
             )
+        if cursor.rowcount == 0:
+            raise ValueError(f"No experiment found with ID {id}.")
 
     def delete(self, id: int):
         """
@@ -433,24 +497,27 @@ class Theseus:
         Raises:
             ValueError: If no experiment with the given ID is found.
         """
-        spool = self.get_by_id(id)
-        if not spool:
-            raise ValueError(f"No experiment found with ID {id}.")
-
         # Remove the database entry
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("DELETE FROM experiments WHERE id = ?", (id,))
+        with self._transaction() as conn:
+            row = conn.execute(
+                "DELETE FROM experiments WHERE id = ? RETURNING name, folder", (id,)
+            ).fetchone()
+        if not row:
+            raise ValueError(f"No experiment found with ID {id}.")
 
-        # Remove the run folder
-        if spool.folder.exists():
-            shutil.rmtree(spool.folder)
+        # Remove the run folder, unless inside bulk(), where it has to wait until the deletion is committed
+        folder = Path(row["folder"])
+        if self._local.bulk:
+            self._local.bulk[-1].append(folder)
+        else:
+            remove_folder(folder)
 
-        print(f"Experiment {id} '{spool.name}' deleted successfully.")
+        print(f"Experiment {id} '{row['name']}' deleted successfully.")
 
     def _cleanup(self, id: int):
         if self.__interrupted:
             return
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             conn.execute(
                 """
                 UPDATE experiments
@@ -477,6 +544,27 @@ def convert_row(row: sqlite3.Row):
     )
 
 
+def remove_folder(folder: Path):
+    if folder.exists():
+        import shutil
+
+        shutil.rmtree(folder)
+
+
+def detect_vc_getter():
+    # git takes precedence, so colocated jj repos report the git commit
+    for probe, getter in (
+        (["git", "rev-parse"], get_git_hash_and_msg),
+        (["jj", "root"], get_jj_changeset_and_msg),
+    ):
+        try:
+            if subprocess.run(probe, capture_output=True, text=True, check=False).returncode == 0:
+                return getter
+        except FileNotFoundError:
+            pass
+    return lambda: (None, None)
+
+
 def get_jj_changeset_and_msg():
     try:
         res = subprocess.run(